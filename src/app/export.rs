@@ -94,8 +94,13 @@ pub fn build_index(mut config: Config, index_path: &Path) -> Result<crate::index
             current_paths.contains(chunk.path.as_str()) && !stale_paths.contains(&chunk.path)
         })
         .collect();
-    for file in ranked_files.iter().filter(|file| stale_paths.contains(&file.relative_path)) {
-        chunks.extend(process_file(file, Some(&redactor), &config, None)?.chunks);
+    let stale_files: Vec<FileInfo> = ranked_files
+        .iter()
+        .filter(|file| stale_paths.contains(&file.relative_path))
+        .cloned()
+        .collect();
+    for processed in process_files(&stale_files, Some(&redactor), &config, None)? {
+        chunks.extend(processed.chunks);
     }
     store.refresh(&ranked_files, &chunks, &graph, &root_path)
 }
@@ -112,11 +117,24 @@ pub fn execute_with_task(
     config.validate()?;
     let started = Instant::now();
     let was_remote = config.repo_url.is_some();
+    // Remote fetches are network-bound; overlap them with the one-time
+    // compilation of the default redaction rules and their RegexSet prefilter
+    // so the CPU is not idle during the clone. Lazy::force is idempotent, so
+    // this only moves work earlier — it never repeats it.
+    let rule_warmup = was_remote.then(|| {
+        std::thread::spawn(|| {
+            once_cell::sync::Lazy::force(&crate::redact::rules::DEFAULT_RULES);
+            once_cell::sync::Lazy::force(&crate::redact::rules::DEFAULT_RULE_SET);
+        })
+    });
     let repo_ctx = fetch_repository(
         config.path.as_deref(),
         config.repo_url.as_deref(),
         config.ref_.as_deref(),
     )?;
+    if let Some(handle) = rule_warmup {
+        let _ = handle.join();
+    }
     let root_path = repo_ctx.root_path.clone();
 
     // When the export target is a remote repository, reload the repo's own
@@ -153,8 +171,7 @@ pub fn execute_with_task(
 
     let (ranked_files, manifest_info) =
         rank_files_with_manifest(&root_path, scanned_files, config.ranking_weights.clone())?;
-    let full_scan_paths =
-        ranked_files.iter().map(|file| file.relative_path.clone()).collect::<HashSet<_>>();
+    let full_scan_len = ranked_files.len();
     let module_run = if matches!(scan_mode, ScanMode::Focused) {
         if let Some(ref focus_path) = options.focus_path {
             // Non-interactive: use the provided focus path.
@@ -196,9 +213,10 @@ pub fn execute_with_task(
         &mut stats,
         &mut dispositions,
     );
-    let index_scope_is_full = module_run.is_none()
-        && selected_files.len() == full_scan_paths.len()
-        && selected_files.iter().all(|file| full_scan_paths.contains(&file.relative_path));
+    // Without a focus module, the byte budget keeps a prefix of the ranked
+    // list, so a length comparison is enough to tell whether the full scan
+    // survived selection — no need to materialize a set of scanned paths.
+    let index_scope_is_full = module_run.is_none() && selected_files.len() == full_scan_len;
 
     let redactor = if config.redact_secrets {
         Some(build_redactor(config.redaction_mode, &config.redaction))
@@ -217,8 +235,9 @@ pub fn execute_with_task(
     let mut all_chunks = Vec::new();
     let mut redactions_by_path: HashMap<String, Vec<RedactionOccurrence>> = HashMap::new();
     let content_overrides = module_run.as_ref().map(|module| &module.content_overrides);
-    for file in &selected_files {
-        let processed = process_file(file, redactor.as_ref(), &config, content_overrides)?;
+    let processed_files =
+        process_files(&selected_files, redactor.as_ref(), &config, content_overrides)?;
+    for (file, processed) in selected_files.iter().zip(processed_files) {
         if !processed.redactions.is_empty() {
             redactions_by_path.insert(file.relative_path.clone(), processed.redactions);
         }
@@ -525,16 +544,62 @@ struct ProcessedFile {
     redactions: Vec<RedactionOccurrence>,
 }
 
+/// Process files in parallel across worker threads, preserving input order.
+///
+/// Per-file work (read, redact, chunk, hash) is CPU-bound and independent, so
+/// files are handed out via a shared index counter and results are reassembled
+/// by position. Falls back to the serial path for tiny batches where thread
+/// startup would dominate.
+fn process_files(
+    files: &[FileInfo],
+    redactor: Option<&Redactor>,
+    config: &Config,
+    content_overrides: Option<&HashMap<PathBuf, String>>,
+) -> Result<Vec<ProcessedFile>> {
+    let workers =
+        std::thread::available_parallelism().map(|n| n.get()).unwrap_or(1).min(files.len());
+    if workers <= 1 {
+        return files
+            .iter()
+            .map(|file| process_file(file, redactor, config, content_overrides))
+            .collect();
+    }
+
+    let next_index = std::sync::atomic::AtomicUsize::new(0);
+    let results: Vec<std::sync::Mutex<Option<Result<ProcessedFile>>>> =
+        files.iter().map(|_| std::sync::Mutex::new(None)).collect();
+    std::thread::scope(|scope| {
+        for _ in 0..workers {
+            scope.spawn(|| loop {
+                let index = next_index.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                let Some(file) = files.get(index) else { break };
+                let processed = process_file(file, redactor, config, content_overrides);
+                *results[index].lock().expect("result slot poisoned") = Some(processed);
+            });
+        }
+    });
+    results
+        .into_iter()
+        .map(|slot| slot.into_inner().expect("result slot poisoned").expect("worker filled slot"))
+        .collect()
+}
+
 fn process_file(
     file: &FileInfo,
     redactor: Option<&Redactor>,
     config: &Config,
     content_overrides: Option<&HashMap<PathBuf, String>>,
 ) -> Result<ProcessedFile> {
-    let canonical_path = file.path.canonicalize().unwrap_or_else(|_| file.path.clone());
-    let raw_content = if let Some(content) =
-        content_overrides.and_then(|m| m.get(&file.path).or_else(|| m.get(&canonical_path)))
-    {
+    // Overrides may be keyed by the scanned path or its canonical form; only
+    // pay for canonicalize (a syscall per file) when an override map exists
+    // and the cheap raw-path lookup misses.
+    let override_content = content_overrides.and_then(|m| {
+        m.get(&file.path).or_else(|| {
+            let canonical_path = file.path.canonicalize().unwrap_or_else(|_| file.path.clone());
+            m.get(&canonical_path)
+        })
+    });
+    let raw_content = if let Some(content) = override_content {
         content.clone()
     } else {
         read_file_safe(&file.path, None, None)
@@ -830,7 +895,7 @@ fn included_chunk_bytes(chunks: &[Chunk]) -> u64 {
 }
 
 fn apply_file_byte_budget(
-    ranked_files: Vec<FileInfo>,
+    mut ranked_files: Vec<FileInfo>,
     max_total_bytes: u64,
     stats: &mut ScanStats,
     dispositions: &mut [FileDisposition],
@@ -839,34 +904,38 @@ fn apply_file_byte_budget(
         return Vec::new();
     }
 
-    let mut selected = Vec::new();
+    // Find the cutoff with a single prefix-sum scan, then split the vector
+    // in place: no per-file clone and no budget bookkeeping past the cutoff.
     let mut total = 0_u64;
-
-    for (idx, file) in ranked_files.iter().enumerate() {
-        let next_total = total.saturating_add(file.size_bytes);
-        if next_total > max_total_bytes {
-            for remaining in &ranked_files[idx..] {
-                stats.files_dropped_budget += 1;
-                set_disposition_reason(
-                    dispositions,
-                    &remaining.relative_path,
-                    FileDispositionReason::DroppedByteBudget,
-                );
-                stats.dropped_files.push(HashMap::from([
-                    ("path".to_string(), json!(remaining.relative_path)),
-                    ("reason".to_string(), json!("bytes_limit")),
-                    ("priority".to_string(), json!(remaining.priority)),
-                ]));
+    let cutoff = ranked_files
+        .iter()
+        .position(|file| {
+            let next_total = total.saturating_add(file.size_bytes);
+            if next_total > max_total_bytes {
+                true
+            } else {
+                total = next_total;
+                false
             }
-            break;
-        }
-
-        total = next_total;
-        selected.push(file.clone());
+        })
+        .unwrap_or(ranked_files.len());
+
+    for remaining in ranked_files.drain(cutoff..) {
+        stats.files_dropped_budget += 1;
+        set_disposition_reason(
+            dispositions,
+            &remaining.relative_path,
+            FileDispositionReason::DroppedByteBudget,
+        );
+        stats.dropped_files.push(HashMap::from([
+            ("path".to_string(), json!(remaining.relative_path)),
+            ("reason".to_string(), json!("bytes_limit")),
+            ("priority".to_string(), json!(remaining.priority)),
+        ]));
     }
 
     stats.total_bytes_included = total;
-    selected
+    ranked_files
 }
 
 fn apply_chunk_token_budget(
@@ -1375,10 +1444,13 @@ fn sanitize_output_component(value: &str, fallback: &str) -> String {
 }
 
 fn build_config_json(config: &Config) -> Value {
-    let mut include_extensions: Vec<String> = config.include_extensions.iter().cloned().collect();
-    include_extensions.sort();
-    let mut exclude_globs: Vec<String> = config.exclude_globs.iter().cloned().collect();
-    exclude_globs.sort();
+    // Sort borrowed slices for deterministic output; serialization copies the
+    // strings anyway, so cloning them up front would just be a second pass.
+    let mut include_extensions: Vec<&str> =
+        config.include_extensions.iter().map(String::as_str).collect();
+    include_extensions.sort_unstable();
+    let mut exclude_globs: Vec<&str> = config.exclude_globs.iter().map(String::as_str).collect();
+    exclude_globs.sort_unstable();
 
     let mode = match config.mode {
         OutputMode::Prompt => "prompt",
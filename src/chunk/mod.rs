@@ -146,6 +146,22 @@ pub fn coalesce_small_chunks_with_max(
         return Vec::new();
     }
 
+    // Fast path: merging requires at least one chunk below `min_tokens`, so
+    // when none is, the pass could only re-sort. Skip the copy and rebuild
+    // entirely if the input is already in (path, start_line) order, which is
+    // how the per-file chunkers emit it.
+    if chunks.iter().all(|chunk| chunk.token_estimate >= min_tokens)
+        && chunks.windows(2).all(|pair| {
+            pair[0]
+                .path
+                .cmp(&pair[1].path)
+                .then_with(|| pair[0].start_line.cmp(&pair[1].start_line))
+                != std::cmp::Ordering::Greater
+        })
+    {
+        return chunks;
+    }
+
     let mut sorted = chunks;
     sorted.sort_by(|a, b| a.path.cmp(&b.path).then_with(|| a.start_line.cmp(&b.start_line)));
 
@@ -2,9 +2,10 @@
 
 use anyhow::Result;
 use clap::Args;
+use std::fmt::Write as _;
 use std::path::PathBuf;
 
-use super::utils::parse_csv;
+use super::utils::{parse_csv, parse_extension_csv};
 use crate::app::export::{execute_with_task, ExportExecutionOptions, TaskExecutionOptions};
 use crate::config::{load_config, merge_cli_with_config, CliOverrides};
 use crate::domain::{OutputMode, ProjectProfile, RedactionMode};
@@ -148,8 +149,7 @@ pub fn run(args: ExportArgs) -> Result<()> {
     };
 
     let file_config = load_config(&config_anchor, args.config.as_deref())?;
-    let include_ext =
-        parse_csv(&args.include_ext).map(|v| v.into_iter().map(normalize_extension).collect());
+    let include_ext = parse_extension_csv(&args.include_ext).map(|v| v.into_iter().collect());
     let exclude_glob = parse_csv(&args.exclude_glob).map(|v| v.into_iter().collect());
     let mode = if args.mode.is_some() { Some(parse_mode(args.mode.as_deref())?) } else { None };
     let redaction_mode = if args.redaction_mode.is_some() {
@@ -208,14 +208,19 @@ pub fn run(args: ExportArgs) -> Result<()> {
         },
     )?;
 
-    println!("Export complete:");
-    println!("  root: {}", outcome.root_path.display());
-    println!("  files: {}", outcome.stats.files_included);
-    println!("  chunks: {}", outcome.stats.chunks_created);
-    println!("  selected content tokens: {}", outcome.stats.total_tokens_estimated);
+    // Assemble the summary in one buffer and emit it with a single write,
+    // instead of taking the stdout lock once per line.
+    let mut summary = String::new();
+    let _ = writeln!(summary, "Export complete:");
+    let _ = writeln!(summary, "  root: {}", outcome.root_path.display());
+    let _ = writeln!(summary, "  files: {}", outcome.stats.files_included);
+    let _ = writeln!(summary, "  chunks: {}", outcome.stats.chunks_created);
+    let _ =
+        writeln!(summary, "  selected content tokens: {}", outcome.stats.total_tokens_estimated);
     for file in outcome.output_files {
-        println!("  wrote: {}", file);
+        let _ = writeln!(summary, "  wrote: {}", file);
     }
+    print!("{summary}");
 
     Ok(())
 }
@@ -266,17 +271,3 @@ pub(crate) fn parse_profile(profile: &str) -> Result<ProjectProfile> {
         other => anyhow::bail!("Invalid profile '{other}'. Expected one of: auto, generic, godot"),
     }
 }
-
-/// Normalize a file extension from `--include-ext` to always start with a dot.
-///
-/// For example, `"rs"` becomes `".rs"`, while `".py"` stays as `".py"`.
-fn normalize_extension(ext: String) -> String {
-    let trimmed = ext.trim();
-    if trimmed.starts_with('.') {
-        trimmed.to_string()
-    } else if !trimmed.is_empty() {
-        format!(".{}", trimmed)
-    } else {
-        trimmed.to_string()
-    }
-}
@@ -5,7 +5,7 @@ use clap::Args;
 use std::collections::HashSet;
 use std::path::PathBuf;
 
-use super::utils::parse_csv;
+use super::utils::{parse_csv, parse_extension_csv};
 use crate::chunk::code_chunker::supported_tree_sitter_languages;
 use crate::config::{merge_cli_with_config, CliOverrides};
 use crate::domain::Config;
@@ -56,7 +56,7 @@ pub fn run(args: InfoArgs) -> Result<()> {
         anyhow::bail!("Path is not a directory: {}", root.display());
     }
 
-    let include_ext = parse_csv(&args.include_ext);
+    let include_ext = parse_extension_csv(&args.include_ext);
     let exclude_glob = parse_csv(&args.exclude_glob);
 
     let mut config = merge_cli_with_config(
@@ -6,6 +6,7 @@
 
 use anyhow::Result;
 use clap::{Parser, Subcommand};
+use std::io::IsTerminal;
 use tracing::Level;
 use tracing_subscriber::{fmt, prelude::*, EnvFilter};
 
@@ -64,8 +65,11 @@ pub fn run() -> Result<()> {
     } else {
         EnvFilter::from_default_env().add_directive(Level::WARN.into())
     };
+    // Skip ANSI escape emission when stderr is piped (CI, scripted runs):
+    // the codes are pure overhead in log files and confuse simple parsers.
+    let ansi = std::io::stderr().is_terminal();
     let _ = tracing_subscriber::registry()
-        .with(fmt::layer().with_writer(std::io::stderr))
+        .with(fmt::layer().with_writer(std::io::stderr).with_ansi(ansi))
         .with(filter)
         .try_init();
 
@@ -11,3 +11,15 @@ pub fn parse_csv(value: &Option<String>) -> Option<Vec<String>> {
             .collect::<Vec<_>>()
     })
 }
+
+/// Parse a comma-separated extension list, normalizing every entry to start
+/// with a dot in the same pass (`"rs"` becomes `".rs"`, `".py"` is unchanged).
+pub fn parse_extension_csv(value: &Option<String>) -> Option<Vec<String>> {
+    value.as_ref().map(|s| {
+        s.split(',')
+            .map(str::trim)
+            .filter(|part| !part.is_empty())
+            .map(|part| if part.starts_with('.') { part.to_string() } else { format!(".{part}") })
+            .collect::<Vec<_>>()
+    })
+}
@@ -95,30 +95,54 @@ fn parse_toml_config(content: &str, config_file: &Path) -> Result<Config> {
         .with_context(|| format!("Invalid TOML syntax: {}", config_file.display()))?;
 
     // Check for nested section (Python lines 263-266)
-    // Prefer repo-context, then r2p.
-    let config_val = if let Some(nested) = raw.get("repo-context") {
-        nested.clone()
-    } else if let Some(nested) = raw.get("r2p") {
-        nested.clone()
-    } else {
-        raw
+    // Prefer repo-context, then r2p. Take the nested table out of the owned
+    // document instead of deep-cloning it.
+    let config_val = match raw {
+        toml::Value::Table(mut table) => {
+            if let Some(nested) = table.remove("repo-context") {
+                nested
+            } else if let Some(nested) = table.remove("r2p") {
+                nested
+            } else {
+                toml::Value::Table(table)
+            }
+        }
+        other => other,
     };
 
     // Deserialize to Config
     config_val.try_into().with_context(|| format!("Invalid TOML config: {}", config_file.display()))
 }
 
-fn discover_config(repo_root: &Path) -> Option<std::path::PathBuf> {
-    let candidates = ["repo-context.toml", ".repo-context.toml", "r2p.toml", ".r2p.toml"];
+/// Auto-discovery candidates, highest priority first.
+const CONFIG_FILE_NAMES: [&str; 4] =
+    ["repo-context.toml", ".repo-context.toml", "r2p.toml", ".r2p.toml"];
 
-    for candidate in candidates {
-        let path = repo_root.join(candidate);
-        if path.exists() {
-            return Some(path);
+fn discover_config(repo_root: &Path) -> Option<std::path::PathBuf> {
+    // One directory read instead of a stat per candidate name; the common
+    // no-config case then costs a single syscall. Track only the best
+    // (lowest-index) hit so there is no second pass over the candidates, and
+    // stop reading entries once the top-priority name is found.
+    let entries = fs::read_dir(repo_root).ok()?;
+    let mut best: Option<usize> = None;
+    for entry in entries.flatten() {
+        let Some(index) = CONFIG_FILE_NAMES.iter().position(|name| entry.file_name() == **name)
+        else {
+            continue;
+        };
+        if best.is_some_and(|current| current <= index) {
+            continue;
+        }
+        // exists() runs only on a hit and keeps the old behavior for dangling
+        // symlinks, which a directory listing alone would accept.
+        if entry.path().exists() {
+            best = Some(index);
+            if index == 0 {
+                break;
+            }
         }
     }
-
-    None
+    best.map(|index| repo_root.join(CONFIG_FILE_NAMES[index]))
 }
 
 #[cfg(test)]
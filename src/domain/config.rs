@@ -1,6 +1,7 @@
 #![allow(missing_docs)]
 
 use crate::domain::{OutputMode, RankingWeights, RedactionConfig, RedactionMode};
+use once_cell::sync::Lazy;
 use serde::{de, Deserialize, Serialize};
 use std::collections::HashSet;
 use std::path::PathBuf;
@@ -184,6 +185,10 @@ fn default_tree_depth() -> usize {
 
 /// Default file extensions to include in scanning.
 pub fn default_include_extensions() -> HashSet<String> {
+    DEFAULT_INCLUDE_EXTENSIONS.clone()
+}
+
+static DEFAULT_INCLUDE_EXTENSIONS: Lazy<HashSet<String>> = Lazy::new(|| {
     [
         ".py",
         ".pyi",
@@ -239,10 +244,21 @@ pub fn default_include_extensions() -> HashSet<String> {
     .iter()
     .map(|s| s.to_string())
     .collect()
-}
+});
 
 /// Default glob patterns to exclude from scanning.
 pub fn default_exclude_globs() -> HashSet<String> {
+    DEFAULT_EXCLUDE_GLOBS.clone()
+}
+
+/// Whether `globs` is exactly the default exclude set, so callers can reuse
+/// artifacts compiled once from the defaults instead of rebuilding them.
+pub fn is_default_exclude_globs(globs: &[String]) -> bool {
+    globs.len() == DEFAULT_EXCLUDE_GLOBS.len()
+        && globs.iter().all(|glob| DEFAULT_EXCLUDE_GLOBS.contains(glob))
+}
+
+static DEFAULT_EXCLUDE_GLOBS: Lazy<HashSet<String>> = Lazy::new(|| {
     [
         "dist/**",
         "**/dist/**",
@@ -296,102 +312,74 @@ pub fn default_exclude_globs() -> HashSet<String> {
     .iter()
     .map(|s| s.to_string())
     .collect()
+});
+
+/// Normalize one extension token: trim, drop empties, ensure a leading dot.
+fn normalize_extension(token: &str) -> Option<String> {
+    let trimmed = token.trim();
+    if trimmed.is_empty() {
+        return None;
+    }
+    Some(if trimmed.starts_with('.') { trimmed.to_string() } else { format!(".{}", trimmed) })
 }
 
 fn deserialize_extensions<'de, D>(deserializer: D) -> Result<HashSet<String>, D::Error>
 where
     D: serde::Deserializer<'de>,
 {
-    struct ExtensionsVisitor;
-
-    impl<'de> de::Visitor<'de> for ExtensionsVisitor {
-        type Value = HashSet<String>;
-
-        fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
-            formatter.write_str("a string, array, or set of extensions")
-        }
-
-        fn visit_str<E>(self, value: &str) -> Result<Self::Value, E>
-        where
-            E: de::Error,
-        {
-            let mut result = HashSet::new();
-            for ext in value.split(',') {
-                let trimmed = ext.trim();
-                if !trimmed.is_empty() {
-                    let normalized = if trimmed.starts_with('.') {
-                        trimmed.to_string()
-                    } else {
-                        format!(".{}", trimmed)
-                    };
-                    result.insert(normalized);
-                }
-            }
-            Ok(result)
-        }
-
-        fn visit_seq<A>(self, mut seq: A) -> Result<Self::Value, A::Error>
-        where
-            A: de::SeqAccess<'de>,
-        {
-            let mut result = HashSet::new();
-            while let Some(ext) = seq.next_element::<String>()? {
-                let trimmed = ext.trim();
-                if !trimmed.is_empty() {
-                    let normalized = if trimmed.starts_with('.') {
-                        trimmed.to_string()
-                    } else {
-                        format!(".{}", trimmed)
-                    };
-                    result.insert(normalized);
-                }
-            }
-            Ok(result)
-        }
-    }
-
-    deserializer.deserialize_any(ExtensionsVisitor)
+    deserializer.deserialize_any(TokenSetVisitor {
+        expecting: "a string, array, or set of extensions",
+        normalize: normalize_extension,
+    })
 }
 
 fn deserialize_globs<'de, D>(deserializer: D) -> Result<HashSet<String>, D::Error>
 where
     D: serde::Deserializer<'de>,
 {
-    struct GlobsVisitor;
+    deserializer.deserialize_any(TokenSetVisitor {
+        expecting: "a string, array, or set of globs",
+        normalize: normalize_glob,
+    })
+}
 
-    impl<'de> de::Visitor<'de> for GlobsVisitor {
-        type Value = HashSet<String>;
+/// Normalize one glob token: trim and drop empties.
+fn normalize_glob(token: &str) -> Option<String> {
+    let trimmed = token.trim();
+    (!trimmed.is_empty()).then(|| trimmed.to_string())
+}
 
-        fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
-            formatter.write_str("a string, array, or set of globs")
-        }
+/// Shared visitor for the comma-string / array forms both token-set fields
+/// accept; the two fields differ only in their per-token normalizer.
+struct TokenSetVisitor {
+    expecting: &'static str,
+    normalize: fn(&str) -> Option<String>,
+}
 
-        fn visit_str<E>(self, value: &str) -> Result<Self::Value, E>
-        where
-            E: de::Error,
-        {
-            Ok(value
-                .split(',')
-                .map(str::trim)
-                .filter(|glob| !glob.is_empty())
-                .map(|glob| glob.to_string())
-                .collect())
-        }
+impl<'de> de::Visitor<'de> for TokenSetVisitor {
+    type Value = HashSet<String>;
+
+    fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+        formatter.write_str(self.expecting)
+    }
 
-        fn visit_seq<A>(self, mut seq: A) -> Result<Self::Value, A::Error>
-        where
-            A: de::SeqAccess<'de>,
-        {
-            let mut result = HashSet::new();
-            while let Some(glob) = seq.next_element::<String>()? {
-                let trimmed = glob.trim();
-                if !trimmed.is_empty() {
-                    result.insert(trimmed.to_string());
-                }
+    fn visit_str<E>(self, value: &str) -> Result<Self::Value, E>
+    where
+        E: de::Error,
+    {
+        Ok(value.split(',').filter_map(self.normalize).collect())
+    }
+
+    fn visit_seq<A>(self, mut seq: A) -> Result<Self::Value, A::Error>
+    where
+        A: de::SeqAccess<'de>,
+    {
+        let mut result = HashSet::new();
+        while let Some(token) = seq.next_element::<String>()? {
+            if let Some(normalized) = (self.normalize)(&token) {
+                result.insert(normalized);
             }
-            Ok(result)
         }
+        Ok(result)
     }
-
-    deserializer.deserialize_any(GlobsVisitor)
 }
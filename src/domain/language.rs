@@ -1,7 +1,19 @@
+use std::borrow::Cow;
+
+/// Lowercase only when needed; extensions and filenames are almost always
+/// lowercase already, and this runs once per scanned file.
+fn lowercased(text: &str) -> Cow<'_, str> {
+    if text.bytes().any(|byte| byte.is_ascii_uppercase()) {
+        Cow::Owned(text.to_lowercase())
+    } else {
+        Cow::Borrowed(text)
+    }
+}
+
 /// Get language from file extension or special filename.
 pub fn get_language(extension: &str, filename: &str) -> String {
-    let ext = extension.to_lowercase();
-    let lang = match ext.as_str() {
+    let ext = lowercased(extension);
+    let lang = match ext.as_ref() {
         ".py" | ".pyi" | ".pyx" => "python",
         ".js" | ".jsx" | ".mjs" | ".cjs" => "javascript",
         ".ts" | ".tsx" => "typescript",
@@ -51,7 +63,7 @@ pub fn get_language(extension: &str, filename: &str) -> String {
         ".graphql" => "graphql",
         ".proto" => "protobuf",
         _ => {
-            let name = filename.to_lowercase();
+            let name = lowercased(filename);
             if name == "dockerfile" {
                 return "dockerfile".to_string();
             }
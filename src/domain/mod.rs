@@ -12,8 +12,8 @@ mod stats;
 
 pub use chunk::Chunk;
 pub use config::{
-    default_exclude_globs, default_include_extensions, godot_text_extensions, Config, ModuleConfig,
-    ProjectProfile,
+    default_exclude_globs, default_include_extensions, godot_text_extensions,
+    is_default_exclude_globs, Config, ModuleConfig, ProjectProfile,
 };
 pub use disposition::{FileDisposition, FileDispositionReason};
 pub use file::FileInfo;
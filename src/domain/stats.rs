@@ -86,7 +86,7 @@ impl ScanStats {
     /// Produce a stable JSON value for report emission.
     pub fn to_report_value(&self) -> serde_json::Value {
         let mut langs: Vec<(&String, &usize)> = self.languages_detected.iter().collect();
-        langs.sort_by(|a, b| b.1.cmp(a.1).then_with(|| a.0.cmp(b.0)));
+        langs.sort_unstable_by(|a, b| b.1.cmp(a.1).then_with(|| a.0.cmp(b.0)));
         let languages_detected: serde_json::Map<String, serde_json::Value> =
             langs.into_iter().map(|(k, v)| (k.clone(), serde_json::json!(v))).collect();
 
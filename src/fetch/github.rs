@@ -26,6 +26,14 @@ pub fn clone_repository(url: &str, ref_: Option<&str>) -> Result<RepoContext> {
         classify_remote_url(url)? == RemoteKind::Github,
         "repository URL is not a supported GitHub URL"
     );
+    clone_classified(url, ref_)
+}
+
+/// Clone a URL the dispatcher has already classified as GitHub.
+///
+/// Skips the classification re-run that the public entry point performs, so
+/// dispatch through [`crate::fetch::fetch_repository`] parses each URL once.
+pub(crate) fn clone_classified(url: &str, ref_: Option<&str>) -> Result<RepoContext> {
     let temp_dir = build_temp_repo_dir();
     std::fs::create_dir_all(&temp_dir)
         .with_context(|| format!("Failed creating temp directory: {}", temp_dir.display()))?;
@@ -77,25 +85,31 @@ fn normalize_github_url(url: &str) -> String {
 fn try_shallow_clone_with_branch(url: &str, dest: &Path, branch: &str) -> Result<Repository> {
     let mut builder = git2::build::RepoBuilder::new();
     builder.branch(branch);
-
-    let mut fo = FetchOptions::new();
-    fo.depth(1);
-    builder.fetch_options(fo);
+    builder.fetch_options(shallow_fetch_options());
 
     builder.clone(url, dest).with_context(|| format!("Shallow clone with branch {branch} failed"))
 }
 
 /// Shallow clone (depth=1) the default branch.
 fn shallow_clone(url: &str, dest: &Path) -> Result<Repository> {
-    let mut fo = FetchOptions::new();
-    fo.depth(1);
-
     let mut builder = git2::build::RepoBuilder::new();
-    builder.fetch_options(fo);
+    builder.fetch_options(shallow_fetch_options());
 
     builder.clone(url, dest).with_context(|| format!("Shallow clone from {url} failed"))
 }
 
+/// Fetch options for the shallow-clone paths: depth=1 and no tag auto-follow.
+///
+/// Tags are only needed when checking out an arbitrary ref, which the full
+/// fallback clone handles; skipping them here avoids transferring tag objects
+/// on repositories with large tag histories.
+fn shallow_fetch_options() -> FetchOptions<'static> {
+    let mut fo = FetchOptions::new();
+    fo.depth(1);
+    fo.download_tags(git2::AutotagOption::None);
+    fo
+}
+
 fn checkout_ref(repo: &Repository, reference: &str) -> Result<()> {
     let object = repo
         .revparse_single(reference)
@@ -47,6 +47,11 @@ pub fn parse_huggingface_url(url: &str) -> Result<HfParsed> {
         classify_remote_url(url)? == RemoteKind::HuggingFace,
         "unsupported HuggingFace URL"
     );
+    parse_classified(url)
+}
+
+/// Parse a URL the dispatcher has already classified as HuggingFace.
+fn parse_classified(url: &str) -> Result<HfParsed> {
     let (_, path) = https_host_and_path(url)?;
 
     let parts: Vec<&str> = path.split('/').filter(|s| !s.is_empty()).collect();
@@ -89,8 +94,18 @@ pub fn parse_huggingface_url(url: &str) -> Result<HfParsed> {
 
 /// Clone a HuggingFace repository to a temporary directory.
 pub fn clone_repository(url: &str, ref_: Option<&str>) -> Result<RepoContext> {
-    let parsed = parse_huggingface_url(url)?;
+    clone_parsed(parse_huggingface_url(url)?, ref_)
+}
+
+/// Clone a URL the dispatcher has already classified as HuggingFace.
+///
+/// Skips the classification re-run inside [`parse_huggingface_url`], so
+/// dispatch through [`crate::fetch::fetch_repository`] parses each URL once.
+pub(crate) fn clone_classified(url: &str, ref_: Option<&str>) -> Result<RepoContext> {
+    clone_parsed(parse_classified(url)?, ref_)
+}
 
+fn clone_parsed(parsed: HfParsed, ref_: Option<&str>) -> Result<RepoContext> {
     // Resolve the ref: prefer explicit argument, then URL-embedded ref.
     let resolved_ref = ref_.map(str::to_string).or(parsed.ref_);
 
@@ -10,8 +10,9 @@ use std::path::{Path, PathBuf};
 ///   prints a notice and returns that ancestor.
 /// - If no `.git` is found, prints a notice and returns `start` unchanged.
 pub fn find_repo_root(start: &Path) -> PathBuf {
-    let mut current = start.to_path_buf();
-    loop {
+    // ancestors() yields borrowed parents, so the walk allocates only the
+    // .git probe path per level and one PathBuf for the returned root.
+    for current in start.ancestors() {
         if current.join(".git").exists() {
             if current != start {
                 tracing::info!(
@@ -20,11 +21,7 @@ pub fn find_repo_root(start: &Path) -> PathBuf {
                     start.display()
                 );
             }
-            return current;
-        }
-        match current.parent() {
-            Some(parent) => current = parent.to_path_buf(),
-            None => break,
+            return current.to_path_buf();
         }
     }
     // No .git found anywhere — use the provided path as-is.
@@ -46,12 +43,10 @@ pub fn find_repo_root(start: &Path) -> PathBuf {
 /// - The path isn't a directory
 /// - The path can't be canonicalized
 pub fn validate_local_path(path: &Path) -> Result<RepoContext> {
+    // canonicalize stats the path and fails when it is missing, so a separate
+    // exists() check afterwards would just repeat the syscall.
     let canonical = path.canonicalize()?;
 
-    if !canonical.exists() {
-        anyhow::bail!("Path does not exist: {}", path.display());
-    }
-
     if !canonical.is_dir() {
         anyhow::bail!("Path is not a directory: {}", path.display());
     }
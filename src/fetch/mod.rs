@@ -26,8 +26,7 @@ pub(crate) fn classify_remote_url(url: &str) -> Result<RemoteKind> {
     }
     if url.starts_with("git@github.com:") {
         let path = url.trim_start_matches("git@github.com:");
-        validate_repo_path(path, "GitHub")?;
-        if path.trim_matches('/').split('/').filter(|part| !part.is_empty()).count() != 2 {
+        if validate_repo_path(path, "GitHub")? != 2 {
             anyhow::bail!("GitHub repository URL must contain exactly owner/repository");
         }
         return Ok(RemoteKind::Github);
@@ -40,16 +39,14 @@ pub(crate) fn classify_remote_url(url: &str) -> Result<RemoteKind> {
             "Unsupported repository host '{host}'; only GitHub and HuggingFace HTTPS URLs are supported"
         ),
     };
-    validate_repo_path(
+    let segments = validate_repo_path(
         path,
         match kind {
             RemoteKind::Github => "GitHub",
             RemoteKind::HuggingFace => "HuggingFace",
         },
     )?;
-    if kind == RemoteKind::Github
-        && path.trim_matches('/').split('/').filter(|part| !part.is_empty()).count() != 2
-    {
+    if kind == RemoteKind::Github && segments != 2 {
         anyhow::bail!("GitHub repository URL must contain exactly owner/repository");
     }
     Ok(kind)
@@ -68,18 +65,25 @@ pub(crate) fn https_host_and_path(url: &str) -> Result<(&str, &str)> {
     Ok((host, path))
 }
 
-fn validate_repo_path(path: &str, provider: &str) -> Result<()> {
-    let parts =
-        path.trim_matches('/').split('/').filter(|part| !part.is_empty()).collect::<Vec<_>>();
-    if parts.len() < 2
-        || parts.iter().any(|part| *part == "." || *part == ".." || part.contains('\\'))
-    {
-        anyhow::bail!("{provider} repository URL has an invalid owner/repository path");
+/// Validates the owner/repository path segments and returns how many there are.
+///
+/// Walks the segments once instead of collecting them, so classification does
+/// not re-split the path to count segments afterwards.
+fn validate_repo_path(path: &str, provider: &str) -> Result<usize> {
+    let mut segments = 0usize;
+    for part in path.trim_matches('/').split('/').filter(|part| !part.is_empty()) {
+        if part == "." || part == ".." || part.contains('\\') {
+            anyhow::bail!("{provider} repository URL has an invalid owner/repository path");
+        }
+        if part.chars().any(char::is_control) {
+            anyhow::bail!("{provider} repository URL contains control characters");
+        }
+        segments += 1;
     }
-    if parts.iter().any(|part| part.chars().any(char::is_control)) {
-        anyhow::bail!("{provider} repository URL contains control characters");
+    if segments < 2 {
+        anyhow::bail!("{provider} repository URL has an invalid owner/repository path");
     }
-    Ok(())
+    Ok(segments)
 }
 
 /// Fetch a repository from local path or remote URL.
@@ -97,8 +101,8 @@ pub fn fetch_repository(
         local::validate_local_path(p)
     } else if let Some(url) = repo_url {
         match classify_remote_url(url)? {
-            RemoteKind::HuggingFace => huggingface::clone_repository(url, ref_),
-            RemoteKind::Github => github::clone_repository(url, ref_),
+            RemoteKind::HuggingFace => huggingface::clone_classified(url, ref_),
+            RemoteKind::Github => github::clone_classified(url, ref_),
         }
     } else {
         anyhow::bail!("Either path or repo_url must be specified")
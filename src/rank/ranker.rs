@@ -30,6 +30,11 @@ const IMPORTANT_DOC_FILES: &[&str] = &[
 const CONTRIBUTION_DOC_PREFIXES: &[&str] =
     &["contributing", "code_of_conduct", "security", "authors", "maintainers"];
 
+/// CONTRIBUTION_DOC_PREFIXES with a leading slash, kept in the same order, so
+/// the per-file path check does not rebuild these strings on every call.
+const SLASHED_CONTRIBUTION_DOC_PREFIXES: &[&str] =
+    &["/contributing", "/code_of_conduct", "/security", "/authors", "/maintainers"];
+
 const IMPORTANT_CONFIG_FILES: &[&str] = &[
     "pyproject.toml",
     "package.json",
@@ -232,7 +237,7 @@ impl FileRanker {
 
         FileSignals {
             is_readme,
-            is_contribution_doc: is_contribution_doc(rel_normalized, name),
+            is_contribution_doc: is_contribution_doc(rel_lower, name),
             is_main_doc: is_important_doc(rel_normalized, name),
             is_vendored: is_vendored(&file.path),
             is_lock_file: is_lock_file(&file.path),
@@ -289,11 +294,12 @@ impl FileRanker {
             self.rank_file(file);
         }
 
-        files.sort_by(|a, b| {
-            b.priority
-                .partial_cmp(&a.priority)
-                .unwrap_or(std::cmp::Ordering::Equal)
-                .then_with(|| a.relative_path.cmp(&b.relative_path))
+        // total_cmp avoids the Option branch of partial_cmp on every
+        // comparison, and the path tie-break already makes the order fully
+        // deterministic, so an unstable sort is safe and skips the stable
+        // sort's temporary allocation.
+        files.sort_unstable_by(|a, b| {
+            b.priority.total_cmp(&a.priority).then_with(|| a.relative_path.cmp(&b.relative_path))
         });
     }
 
@@ -588,30 +594,33 @@ fn is_example_file(rel: &str) -> bool {
 }
 
 fn is_doc_file(name: &str, rel: &str) -> bool {
-    let rel_lower = rel.to_lowercase();
     // Check extension: .md, .rst, .txt, .adoc are considered doc files (matches Python is_doc)
-    let ext = std::path::Path::new(name)
-        .extension()
-        .and_then(|e| e.to_str())
-        .map(|e| format!(".{}", e.to_lowercase()))
-        .unwrap_or_default();
-    let is_doc_ext = matches!(ext.as_str(), ".md" | ".rst" | ".txt" | ".adoc");
+    let is_doc_ext =
+        std::path::Path::new(name).extension().and_then(|e| e.to_str()).is_some_and(|ext| {
+            ext.eq_ignore_ascii_case("md")
+                || ext.eq_ignore_ascii_case("rst")
+                || ext.eq_ignore_ascii_case("txt")
+                || ext.eq_ignore_ascii_case("adoc")
+        });
 
     is_important_doc(rel, name)
         || is_doc_ext
-        || rel_lower.starts_with("docs/")
-        || rel_lower.starts_with("documentation/")
+        || starts_with_ignore_ascii_case(rel, "docs/")
+        || starts_with_ignore_ascii_case(rel, "documentation/")
+}
+
+fn starts_with_ignore_ascii_case(text: &str, prefix: &str) -> bool {
+    text.len() >= prefix.len()
+        && text.as_bytes()[..prefix.len()].eq_ignore_ascii_case(prefix.as_bytes())
 }
 
 fn is_important_doc(rel: &str, name: &str) -> bool {
     IMPORTANT_DOC_FILES.contains(&rel)
         || IMPORTANT_DOC_FILES.contains(&name)
-        || IMPORTANT_DOC_FILES.iter().any(|d| d.to_lowercase() == name.to_lowercase())
+        || IMPORTANT_DOC_FILES.iter().any(|d| d.eq_ignore_ascii_case(name))
 }
 
-fn is_contribution_doc(rel: &str, name: &str) -> bool {
-    let rel_lower = rel.to_lowercase();
-    let name_lower = name.to_lowercase();
+fn is_contribution_doc(rel_lower: &str, name_lower: &str) -> bool {
     if rel_lower.starts_with(".github/pull_request_template")
         || rel_lower.starts_with(".github/issue_template/")
     {
@@ -619,7 +628,8 @@ fn is_contribution_doc(rel: &str, name: &str) -> bool {
     }
     CONTRIBUTION_DOC_PREFIXES
         .iter()
-        .any(|prefix| name_lower.starts_with(prefix) || rel_lower.contains(&format!("/{prefix}")))
+        .zip(SLASHED_CONTRIBUTION_DOC_PREFIXES)
+        .any(|(prefix, slashed)| name_lower.starts_with(prefix) || rel_lower.contains(slashed))
 }
 
 fn is_ci_workflow(rel: &str) -> bool {
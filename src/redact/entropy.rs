@@ -1,12 +1,15 @@
 //! Entropy calculation for secret detection
 
-use std::collections::HashMap;
-
 /// Calculates the Shannon entropy of a string.
 ///
 /// Higher entropy indicates more randomness, which can indicate
 /// potential secrets or API keys.
 ///
+/// Tallies bytes into a fixed 256-entry histogram instead of hashing chars;
+/// the candidates the redactor scans are ASCII tokens, where the byte and
+/// character distributions are identical, and the histogram stays
+/// cache-resident across the many candidates a file can produce.
+///
 /// # Arguments
 /// * `s` - The string to analyze
 ///
@@ -17,26 +20,63 @@ pub fn calculate_entropy(s: &str) -> f64 {
         return 0.0;
     }
 
-    let mut counts: HashMap<char, usize> = HashMap::new();
-    let mut len = 0usize;
-    for ch in s.chars() {
-        *counts.entry(ch).or_insert(0) += 1;
-        len += 1;
+    let mut counts = [0u32; 256];
+    for byte in s.bytes() {
+        counts[byte as usize] += 1;
+    }
+
+    let len_f = s.len() as f64;
+    // Accumulate in natural log and convert once at the end; one multiply
+    // replaces a log2 per histogram slot.
+    let nat_sum: f64 = counts
+        .iter()
+        .filter(|count| **count > 0)
+        .map(|count| {
+            let p = f64::from(*count) / len_f;
+            -(p * p.ln())
+        })
+        .sum();
+    nat_sum * std::f64::consts::LOG2_E
+}
+
+/// Returns true when the Shannon entropy of `s` is at least `threshold`.
+///
+/// Builds the same byte histogram as [`calculate_entropy`] but checks the
+/// distinct-symbol upper bound first: a string drawn from k distinct bytes
+/// cannot exceed log2(k) bits, so most ordinary-text candidates are rejected
+/// before any per-slot logarithms run.
+pub fn entropy_at_least(s: &str, threshold: f64) -> bool {
+    if s.is_empty() {
+        return 0.0 >= threshold;
+    }
+
+    let mut counts = [0u32; 256];
+    let mut distinct = 0u32;
+    for byte in s.bytes() {
+        if counts[byte as usize] == 0 {
+            distinct += 1;
+        }
+        counts[byte as usize] += 1;
+    }
+    if f64::from(distinct).log2() < threshold {
+        return false;
     }
 
-    let len_f = len as f64;
-    counts
-        .values()
+    let len_f = s.len() as f64;
+    let nat_sum: f64 = counts
+        .iter()
+        .filter(|count| **count > 0)
         .map(|count| {
-            let p = *count as f64 / len_f;
-            -(p * p.log2())
+            let p = f64::from(*count) / len_f;
+            -(p * p.ln())
         })
-        .sum()
+        .sum();
+    nat_sum * std::f64::consts::LOG2_E >= threshold
 }
 
 #[cfg(test)]
 mod tests {
-    use super::calculate_entropy;
+    use super::{calculate_entropy, entropy_at_least};
 
     #[test]
     fn entropy_is_zero_for_repeated_chars() {
@@ -47,4 +87,13 @@ mod tests {
     fn entropy_higher_for_mixed_string() {
         assert!(calculate_entropy("a1b2c3d4") > calculate_entropy("aaaaaaaa"));
     }
+
+    #[test]
+    fn entropy_at_least_agrees_with_calculate_entropy() {
+        for (s, threshold) in
+            [("aaaaaa", 0.5), ("a1b2c3d4", 2.0), ("ABCDEFGHIJKLMNOPQRSTUVWXYZ123456", 4.5)]
+        {
+            assert_eq!(entropy_at_least(s, threshold), calculate_entropy(s) >= threshold, "{s}");
+        }
+    }
 }
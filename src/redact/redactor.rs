@@ -1,42 +1,53 @@
 //! Redactor implementation
 
 use crate::domain::{is_programming_language, CustomRedactionRule, RedactionConfig};
-use crate::redact::entropy::calculate_entropy;
-use crate::redact::rules::{RedactionRule, DEFAULT_RULES};
-use globset::Glob;
+use crate::redact::entropy::entropy_at_least;
+use crate::redact::rules::{RedactionRule, DEFAULT_RULES, DEFAULT_RULE_SET};
+use globset::{Glob, GlobSet, GlobSetBuilder};
 use once_cell::sync::Lazy;
 use regex::Regex;
 #[cfg(feature = "python-structure-safe")]
 use rustpython_parser::ast;
 #[cfg(feature = "python-structure-safe")]
 use rustpython_parser::Parse;
+use std::borrow::Cow;
 use std::collections::BTreeMap;
 
 const ENTROPY_MIN_LEN: usize = 20;
 
-/// Patterns for safe (non-secret) strings that should not be flagged by entropy detection.
-/// Matches: UUIDs, git SHAs (40-char hex), MD5 (32-char hex), SHA-256 (64-char hex),
-/// semver strings, and package-manager subresource-integrity hashes.
-static SAFE_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
-    vec![
-        // UUID
-        Regex::new(r"(?i)^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$").unwrap(),
-        // Git SHA (exactly 40 hex chars)
-        Regex::new(r"^[0-9a-f]{40}$").unwrap(),
-        // MD5 (exactly 32 hex chars)
-        Regex::new(r"^[0-9a-f]{32}$").unwrap(),
-        // SHA-256 (exactly 64 hex chars)
-        Regex::new(r"^[0-9a-f]{64}$").unwrap(),
-        // Semver: 1.2.3-beta.4+build.567
-        Regex::new(r"^\d+\.\d+\.\d+[\w\-+.]*$").unwrap(),
-        // npm and other package-manager integrity fields
-        Regex::new(r"^sha(?:256|384|512)-[A-Za-z0-9+/]+={0,2}$").unwrap(),
-    ]
+// Safe (non-secret) string patterns that should not be flagged by entropy
+// detection: UUIDs, git SHAs (40-char hex), MD5 (32-char hex), SHA-256
+// (64-char hex), semver strings, and package-manager subresource-integrity
+// hashes. The hex/UUID forms have fixed lengths, so `is_safe_value` picks at
+// most one of them by candidate length.
+static UUID_PATTERN: Lazy<Regex> = Lazy::new(|| {
+    Regex::new(r"(?i)^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$").unwrap()
 });
+static MD5_PATTERN: Lazy<Regex> = Lazy::new(|| Regex::new(r"^[0-9a-f]{32}$").unwrap());
+static GIT_SHA_PATTERN: Lazy<Regex> = Lazy::new(|| Regex::new(r"^[0-9a-f]{40}$").unwrap());
+static SHA256_PATTERN: Lazy<Regex> = Lazy::new(|| Regex::new(r"^[0-9a-f]{64}$").unwrap());
+// Semver: 1.2.3-beta.4+build.567
+static SEMVER_PATTERN: Lazy<Regex> = Lazy::new(|| Regex::new(r"^\d+\.\d+\.\d+[\w\-+.]*$").unwrap());
+// npm and other package-manager integrity fields
+static INTEGRITY_PATTERN: Lazy<Regex> =
+    Lazy::new(|| Regex::new(r"^sha(?:256|384|512)-[A-Za-z0-9+/]+={0,2}$").unwrap());
 
 /// Returns true if `s` matches a known safe pattern (UUID, hash, semver).
+///
+/// Dispatches the fixed-length hex forms on `len(s)` so a candidate runs at
+/// most one of them, then falls back to the variable-length patterns.
 fn is_safe_value(s: &str) -> bool {
-    SAFE_PATTERNS.iter().any(|re| re.is_match(s))
+    let fixed_len = match s.len() {
+        32 => Some(&MD5_PATTERN),
+        36 => Some(&UUID_PATTERN),
+        40 => Some(&GIT_SHA_PATTERN),
+        64 => Some(&SHA256_PATTERN),
+        _ => None,
+    };
+    if fixed_len.is_some_and(|pattern| pattern.is_match(s)) {
+        return true;
+    }
+    SEMVER_PATTERN.is_match(s) || INTEGRITY_PATTERN.is_match(s)
 }
 
 /// Returns true when a candidate is part of a URL token. URL-aware rules handle
@@ -52,30 +63,43 @@ fn is_url_token(text: &str, token_start: usize) -> bool {
         .any(|c| c.is_whitespace() || matches!(c, '"' | '\'' | '(' | ')' | '[' | ']' | '<' | '>'))
 }
 
-/// Returns true if the filename matches any of the given glob patterns.
-fn matches_glob_pattern(filename: &str, patterns: &[String]) -> bool {
-    patterns.iter().any(|pattern| {
-        Glob::new(pattern).ok().is_some_and(|g| g.compile_matcher().is_match(filename))
-    })
+/// Compile glob patterns into one matcher, skipping invalid patterns.
+///
+/// Compiled once per redactor so the per-file (and per-candidate) checks are
+/// a single set match instead of a compile-per-pattern loop.
+fn build_globset(patterns: &[String]) -> GlobSet {
+    let mut builder = GlobSetBuilder::new();
+    for pattern in patterns {
+        if let Ok(glob) = Glob::new(pattern) {
+            builder.add(glob);
+        }
+    }
+    builder.build().unwrap_or_else(|_| GlobSet::empty())
 }
 
-// Removed hand-rolled glob_match — replaced by globset::Glob above.
-
 /// Main redactor that applies secret detection rules to text content.
 pub struct Redactor {
-    rules: Vec<RedactionRule>,
+    /// Borrows the process-wide compiled default rules; only owns a copy when
+    /// config adds custom rules on top.
+    rules: Cow<'static, [RedactionRule]>,
+    /// Multi-pattern set over `rules`, index-aligned, used to decide in one
+    /// pass which per-rule scans a file needs at all. `None` disables the
+    /// prefilter and every rule runs.
+    rule_prefilter: Option<regex::RegexSet>,
     redact_high_entropy: bool,
     entropy_threshold: f64,
     entropy_min_len: usize,
     /// Pre-compiled regex built from `entropy_min_len` so custom config values are respected.
     entropy_token_regex: Regex,
     structure_safe: bool,
-    source_safe_patterns: Vec<String>,
+    source_safe_globs: GlobSet,
     /// File patterns exempt from paranoid mode (e.g. *.md, *.json, Cargo.lock)
-    safe_file_patterns: Vec<String>,
+    safe_file_globs: GlobSet,
     paranoid_mode: bool,
-    paranoid_min_len: usize,
-    allowlist_patterns: Vec<String>,
+    /// Pre-compiled regex built from the configured paranoid minimum token
+    /// length, like `entropy_token_regex`.
+    paranoid_token_regex: Regex,
+    allowlist_globs: GlobSet,
     allowlist_strings: Vec<String>,
 }
 
@@ -111,17 +135,18 @@ fn build_entropy_regex(min_len: usize) -> Regex {
 impl Default for Redactor {
     fn default() -> Self {
         Self {
-            rules: DEFAULT_RULES.clone(),
+            rules: Cow::Borrowed(DEFAULT_RULES.as_slice()),
+            rule_prefilter: Some(DEFAULT_RULE_SET.clone()),
             redact_high_entropy: false,
             entropy_threshold: 4.5,
             entropy_min_len: ENTROPY_MIN_LEN,
             entropy_token_regex: build_entropy_regex(ENTROPY_MIN_LEN),
             structure_safe: false,
-            source_safe_patterns: Vec::new(),
-            safe_file_patterns: Vec::new(),
+            source_safe_globs: GlobSet::empty(),
+            safe_file_globs: GlobSet::empty(),
             paranoid_mode: false,
-            paranoid_min_len: 32,
-            allowlist_patterns: Vec::new(),
+            paranoid_token_regex: build_entropy_regex(32),
+            allowlist_globs: GlobSet::empty(),
             allowlist_strings: Vec::new(),
         }
     }
@@ -136,26 +161,35 @@ impl Redactor {
         cfg: &RedactionConfig,
     ) -> Self {
         // Compile custom rules from config; skip on regex error with a warning.
-        let mut rules = DEFAULT_RULES.clone();
+        let mut rules = Cow::Borrowed(DEFAULT_RULES.as_slice());
         for cr in &cfg.custom_rules {
             if let Ok(re) = compile_custom_rule(cr) {
-                rules.push(re);
+                rules.to_mut().push(re);
             }
         }
+        let rule_prefilter = match &rules {
+            Cow::Borrowed(_) => Some(DEFAULT_RULE_SET.clone()),
+            // Custom rules extend the set; if the combined set fails to
+            // compile (e.g. size limits), run without a prefilter.
+            Cow::Owned(owned) => {
+                regex::RegexSet::new(owned.iter().map(|rule| rule.pattern.as_str())).ok()
+            }
+        };
 
         let entropy_min_len = cfg.entropy.min_length;
         Self {
             rules,
+            rule_prefilter,
             redact_high_entropy: mode_entropy || cfg.entropy.enabled,
             entropy_threshold: cfg.entropy.threshold,
             entropy_min_len,
             entropy_token_regex: build_entropy_regex(entropy_min_len),
             structure_safe: mode_structure_safe || cfg.structure_safe_redaction,
-            source_safe_patterns: cfg.source_safe_patterns.clone(),
-            safe_file_patterns: cfg.safe_file_patterns.clone(),
+            source_safe_globs: build_globset(&cfg.source_safe_patterns),
+            safe_file_globs: build_globset(&cfg.safe_file_patterns),
             paranoid_mode: mode_paranoid || cfg.paranoid.enabled,
-            paranoid_min_len: cfg.paranoid.min_length,
-            allowlist_patterns: cfg.allowlist_patterns.clone(),
+            paranoid_token_regex: build_entropy_regex(cfg.paranoid.min_length),
+            allowlist_globs: build_globset(&cfg.allowlist_patterns),
             allowlist_strings: cfg.allowlist_strings.clone(),
         }
     }
@@ -165,8 +199,7 @@ impl Redactor {
     /// Matches Python's _is_file_allowlisted behavior (lines 550-552):
     /// checks both filename and full relative path against patterns.
     pub fn is_file_allowlisted(&self, filename: &str, rel_path: &str) -> bool {
-        matches_glob_pattern(filename, &self.allowlist_patterns)
-            || matches_glob_pattern(rel_path, &self.allowlist_patterns)
+        self.allowlist_globs.is_match(filename) || self.allowlist_globs.is_match(rel_path)
     }
 
     /// Returns true if the literal string `s` is in the allowlist.
@@ -183,20 +216,14 @@ impl Redactor {
         if !self.structure_safe {
             return false;
         }
-        if !filename.is_empty() {
-            for pattern in &self.source_safe_patterns {
-                if Glob::new(pattern).is_ok_and(|g| g.compile_matcher().is_match(filename)) {
-                    return true;
-                }
-            }
+        if !filename.is_empty() && self.source_safe_globs.is_match(filename) {
+            return true;
         }
         if !extension.is_empty() {
             // Fall back to extension-based fake filename
             let fake_filename = format!("file{}", extension);
-            for pattern in &self.source_safe_patterns {
-                if Glob::new(pattern).is_ok_and(|g| g.compile_matcher().is_match(&fake_filename)) {
-                    return true;
-                }
+            if self.source_safe_globs.is_match(&fake_filename) {
+                return true;
             }
         }
         false
@@ -207,8 +234,7 @@ impl Redactor {
     /// Matches Python's _is_file_safe (redactor.py lines 556-573):
     /// checks both filename and full relative path against patterns.
     fn is_file_safe(&self, filename: &str, rel_path: &str) -> bool {
-        matches_glob_pattern(filename, &self.safe_file_patterns)
-            || matches_glob_pattern(rel_path, &self.safe_file_patterns)
+        self.safe_file_globs.is_match(filename) || self.safe_file_globs.is_match(rel_path)
     }
 
     /// Redacts text with full context and returns detailed report.
@@ -246,8 +272,20 @@ impl Redactor {
         let mut occurrences = Vec::new();
 
         // ── Pass 1: apply rule-based redactions ──────────────────────────────
+        // One multi-pattern pass over the original text decides which rules
+        // need their own scan; the rest are skipped. Rules run against the
+        // evolving content, but a rule that cannot match the original cannot
+        // match it after edits either: replacements only remove matched
+        // material and insert bracketed markers.
+        let matched_rules = self.rule_prefilter.as_ref().map(|set| set.matches(text));
         let mut after_rules = text.to_string();
-        for rule in &self.rules {
+        for (index, rule) in self.rules.iter().enumerate() {
+            if matched_rules.as_ref().is_some_and(|matched| !matched.matched(index)) {
+                continue;
+            }
+            // Most replacements are plain markers; only templates containing
+            // `$` need per-match capture expansion.
+            let needs_expansion = rule.replacement.contains('$');
             let (next, replaced) =
                 replace_tracked(&after_rules, &rule.pattern, &mut occurrences, rule.name, |caps| {
                     let unquoted_code_reference = rule.name == "generic_secret"
@@ -257,11 +295,16 @@ impl Redactor {
                     if unquoted_code_reference {
                         return None;
                     }
+                    if !needs_expansion {
+                        return Some(rule.replacement.to_string());
+                    }
                     let mut expanded = String::new();
                     caps.expand(rule.replacement, &mut expanded);
                     Some(expanded)
                 });
-            after_rules = next;
+            if let Some(next) = next {
+                after_rules = next;
+            }
             if replaced > 0 {
                 counts.insert(rule.name.to_string(), replaced);
             }
@@ -293,13 +336,21 @@ impl Redactor {
         let file_is_safe = !filename.is_empty() && self.is_file_safe(filename, rel_path);
         let apply_paranoid = self.paranoid_mode && !file_is_safe;
 
+        if !self.redact_high_entropy && !apply_paranoid {
+            // No second pass: skip the content and occurrence snapshots the
+            // revert path below would need.
+            return RedactionOutcome { content: after_rules, counts, occurrences };
+        }
+
         let mut after_entropy = after_rules.clone();
         let rule_occurrences = occurrences.clone();
 
         if self.redact_high_entropy {
             let (entropy_redacted, entropy_count) =
                 self.redact_high_entropy_tokens(&after_entropy, &mut occurrences);
-            after_entropy = entropy_redacted;
+            if let Some(redacted) = entropy_redacted {
+                after_entropy = redacted;
+            }
             if entropy_count > 0 {
                 counts.insert("entropy_detected".to_string(), entropy_count);
             }
@@ -308,7 +359,9 @@ impl Redactor {
         if apply_paranoid {
             let (paranoid_redacted, paranoid_count) =
                 self.redact_paranoid_tokens(&after_entropy, &mut occurrences);
-            after_entropy = paranoid_redacted;
+            if let Some(redacted) = paranoid_redacted {
+                after_entropy = redacted;
+            }
             if paranoid_count > 0 {
                 *counts.entry("paranoid_redacted".to_string()).or_insert(0) += paranoid_count;
             }
@@ -337,7 +390,7 @@ impl Redactor {
         &self,
         text: &str,
         occurrences: &mut Vec<RedactionOccurrence>,
-    ) -> (String, usize) {
+    ) -> (Option<String>, usize) {
         let threshold = if self.paranoid_mode { 3.5 } else { self.entropy_threshold };
         let min_len = self.entropy_min_len;
         replace_tracked(text, &self.entropy_token_regex, occurrences, "entropy_detected", |caps| {
@@ -347,7 +400,7 @@ impl Redactor {
                 && !self.is_string_allowlisted(token)
                 && !is_safe_value(token)
                 && !is_url_token(text, candidate.start())
-                && calculate_entropy(token) >= threshold
+                && entropy_at_least(token, threshold)
             {
                 Some("[HIGH_ENTROPY_REDACTED]".to_string())
             } else {
@@ -360,17 +413,12 @@ impl Redactor {
         &self,
         text: &str,
         occurrences: &mut Vec<RedactionOccurrence>,
-    ) -> (String, usize) {
-        let min_len = self.paranoid_min_len;
+    ) -> (Option<String>, usize) {
         // Paranoid: any alphanumeric+symbols token of min_len or more that isn't already
         // redacted, allowlisted, or a known safe value.
-        let re_src = format!(r"\b([A-Za-z0-9+/=_\-]{{{},}})\b", min_len);
-        let re = match Regex::new(&re_src) {
-            Ok(r) => r,
-            Err(_) => return (text.to_string(), 0),
-        };
-        replace_tracked(text, &re, occurrences, "paranoid_redacted", |caps| {
-            let token = caps.get(1).map(|m| m.as_str()).unwrap_or("");
+        let re = &self.paranoid_token_regex;
+        replace_tracked(text, re, occurrences, "paranoid_redacted", |caps| {
+            let token = caps.get(0).map(|m| m.as_str()).unwrap_or("");
             if self.is_string_allowlisted(token)
                 || is_safe_value(token)
                 || token.contains("[REDACTED")
@@ -392,13 +440,15 @@ fn is_code_reference(value: &str) -> bool {
     })
 }
 
+/// Applies `pattern` to `text` with span tracking; returns `None` as the new
+/// content when nothing matched, so callers keep the input without copying it.
 fn replace_tracked(
     text: &str,
     pattern: &Regex,
     occurrences: &mut Vec<RedactionOccurrence>,
     rule: &str,
     mut replacement: impl FnMut(&regex::Captures<'_>) -> Option<String>,
-) -> (String, usize) {
+) -> (Option<String>, usize) {
     let mut output = String::with_capacity(text.len());
     let mut edits = Vec::new();
     let mut new_occurrences = Vec::new();
@@ -422,7 +472,7 @@ fn replace_tracked(
     }
 
     if edits.is_empty() {
-        return (text.to_string(), 0);
+        return (None, 0);
     }
     output.push_str(&text[last..]);
 
@@ -445,7 +495,7 @@ fn replace_tracked(
     occurrences.extend(new_occurrences);
     occurrences.sort_by_key(|occurrence| occurrence.start);
 
-    (output, edits.len())
+    (Some(output), edits.len())
 }
 
 #[cfg(test)]
@@ -693,7 +743,7 @@ mod tests {
     #[test]
     fn allowlist_file_pattern_skips_redaction() {
         let mut redactor = Redactor::new();
-        redactor.allowlist_patterns = vec!["*.md".to_string()];
+        redactor.allowlist_globs = super::build_globset(&["*.md".to_string()]);
         // With file-level allowlist check, the redactor itself doesn't call is_file_allowlisted
         // during redact() — callers must check is_file_allowlisted() before calling redact.
         assert!(redactor.is_file_allowlisted("README.md", "README.md"));
@@ -739,7 +789,7 @@ mod tests {
     #[test]
     fn test_path_based_allowlist_docs_glob() {
         let mut redactor = Redactor::new();
-        redactor.allowlist_patterns = vec!["docs/**".to_string()];
+        redactor.allowlist_globs = super::build_globset(&["docs/**".to_string()]);
 
         // docs/guide.md matches docs/**
         assert!(
@@ -757,7 +807,7 @@ mod tests {
     #[test]
     fn test_non_allowlisted_path_not_matched() {
         let mut redactor = Redactor::new();
-        redactor.allowlist_patterns = vec!["docs/**".to_string()];
+        redactor.allowlist_globs = super::build_globset(&["docs/**".to_string()]);
 
         // src/main.py is not under docs/
         assert!(
@@ -5,7 +5,7 @@
 //! gets redacted as [STRIPE_SECRET_KEY_REDACTED] instead of generic [SECRET_REDACTED].
 
 use once_cell::sync::Lazy;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 
 /// A single redaction rule defining a pattern and replacement.
 #[derive(Clone)]
@@ -247,6 +247,15 @@ pub static DEFAULT_RULES: Lazy<Vec<RedactionRule>> = Lazy::new(|| {
     ]
 });
 
+/// Multi-pattern matcher over [`DEFAULT_RULES`], compiled once per process.
+///
+/// One `matches()` pass over a file reports which rules can match at all, so
+/// the redactor only runs the per-rule scans for that subset.
+pub static DEFAULT_RULE_SET: Lazy<RegexSet> = Lazy::new(|| {
+    RegexSet::new(DEFAULT_RULES.iter().map(|rule| rule.pattern.as_str()))
+        .expect("default rule patterns compile as a set")
+});
+
 #[cfg(test)]
 mod tests {
     use super::DEFAULT_RULES;
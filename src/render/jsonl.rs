@@ -4,8 +4,44 @@
 
 use crate::domain::Chunk;
 use crate::retrieve::RetrievalPlan;
+use serde::Serialize;
 use serde_json::Value;
-use std::collections::BTreeMap;
+
+/// Flat per-chunk JSONL record borrowing from the source [`Chunk`].
+///
+/// Field order is alphabetical so the serialized key order matches the
+/// previous `BTreeMap`-based rendering (and Python's
+/// `json.dumps(..., sort_keys=True)`).
+#[derive(Serialize)]
+struct ChunkRecord<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    byte_end: Option<usize>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    byte_start: Option<usize>,
+    chunk_hash: &'a str,
+    chunk_index: usize,
+    chunks_in_file: usize,
+    content: &'a str,
+    content_sha256: &'a str,
+    disposition: &'a str,
+    end_line: usize,
+    file_id: &'a str,
+    file_sha256: &'a str,
+    generated: bool,
+    id: &'a str,
+    lang: &'a str,
+    lockfile: bool,
+    minified: bool,
+    path: &'a str,
+    priority: Value,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    retrieval: Option<Value>,
+    role: String,
+    start_line: usize,
+    symbols: Vec<&'a str>,
+    tags: Vec<&'a str>,
+    token_estimate: usize,
+}
 
 /// Renders chunks as JSON Lines format.
 ///
@@ -30,56 +66,14 @@ pub fn render_jsonl(chunks: &[Chunk]) -> String {
 
 /// Renders JSONL and attaches stable task-retrieval evidence when provided.
 pub fn render_jsonl_with_evidence(chunks: &[Chunk], retrieval: Option<&RetrievalPlan>) -> String {
-    let mut lines = Vec::with_capacity(chunks.len());
+    // Stream each serialized line straight into one output buffer; buffering
+    // the lines and joining at the end would briefly hold two copies of the
+    // entire JSONL payload in memory.
+    let mut output = String::new();
     for chunk in chunks {
         let mut tags: Vec<&str> = chunk.tags.iter().map(String::as_str).collect();
         tags.sort();
 
-        // Use BTreeMap so keys are serialized in alphabetical order,
-        // matching Python's json.dumps(..., sort_keys=True).
-        let mut entry: BTreeMap<&str, Value> = BTreeMap::new();
-        entry.insert("content", Value::String(chunk.content.clone()));
-        if let Some(byte_end) = chunk.byte_end {
-            entry.insert("byte_end", Value::Number(byte_end.into()));
-        }
-        if let Some(byte_start) = chunk.byte_start {
-            entry.insert("byte_start", Value::Number(byte_start.into()));
-        }
-        entry.insert("chunk_hash", Value::String(chunk.content_sha256.clone()));
-        entry.insert("chunk_index", Value::Number(chunk.chunk_index.into()));
-        entry.insert("chunks_in_file", Value::Number(chunk.chunks_in_file.into()));
-        entry.insert("content_sha256", Value::String(chunk.content_sha256.clone()));
-        entry.insert("end_line", Value::Number(chunk.end_line.into()));
-        entry.insert("file_id", Value::String(chunk.file_id.clone()));
-        entry.insert("file_sha256", Value::String(chunk.file_sha256.clone()));
-        entry.insert("generated", Value::Bool(chunk.tags.contains("generated")));
-        entry.insert("id", Value::String(chunk.id.clone()));
-        entry.insert("lang", Value::String(chunk.language.clone()));
-        entry.insert("lockfile", Value::Bool(chunk.tags.contains("lock-file")));
-        entry.insert("minified", Value::Bool(chunk.tags.contains("minified")));
-        entry.insert("path", Value::String(chunk.path.clone()));
-        // Value::from(f64) serializes non-finite priorities as null instead of
-        // panicking; priorities are expected to be finite.
-        entry.insert("priority", Value::from((chunk.priority * 1000.0).round() / 1000.0));
-        entry.insert("role", Value::String(tags.join(",")));
-        entry.insert(
-            "disposition",
-            Value::String(
-                if chunk.tags.contains("lock-file") {
-                    "included_summary_only"
-                } else if chunk.chunks_in_file > 1 {
-                    "included_chunked"
-                } else {
-                    "included_full"
-                }
-                .to_string(),
-            ),
-        );
-        entry.insert("start_line", Value::Number(chunk.start_line.into()));
-        entry.insert(
-            "tags",
-            Value::Array(tags.iter().map(|t| Value::String((*t).to_string())).collect()),
-        );
         // Symbol names derived from symbol tags (def:/type:/impl:/...), the
         // same derivation used by the retrieval index `symbols` table.
         let symbols: Vec<&str> = tags
@@ -90,31 +84,54 @@ pub fn render_jsonl_with_evidence(chunks: &[Chunk], retrieval: Option<&Retrieval
             })
             .map(|(_, name)| name)
             .collect();
-        entry.insert(
-            "symbols",
-            Value::Array(symbols.iter().map(|s| Value::String((*s).to_string())).collect()),
-        );
-        entry.insert("token_estimate", Value::Number(chunk.token_estimate.into()));
-        if let Some(evidence) = retrieval.and_then(|plan| plan.evidence_for(chunk)) {
-            entry.insert(
-                "retrieval",
+
+        let record = ChunkRecord {
+            byte_end: chunk.byte_end,
+            byte_start: chunk.byte_start,
+            chunk_hash: &chunk.content_sha256,
+            chunk_index: chunk.chunk_index,
+            chunks_in_file: chunk.chunks_in_file,
+            content: &chunk.content,
+            content_sha256: &chunk.content_sha256,
+            disposition: if chunk.tags.contains("lock-file") {
+                "included_summary_only"
+            } else if chunk.chunks_in_file > 1 {
+                "included_chunked"
+            } else {
+                "included_full"
+            },
+            end_line: chunk.end_line,
+            file_id: &chunk.file_id,
+            file_sha256: &chunk.file_sha256,
+            generated: chunk.tags.contains("generated"),
+            id: &chunk.id,
+            lang: &chunk.language,
+            lockfile: chunk.tags.contains("lock-file"),
+            minified: chunk.tags.contains("minified"),
+            path: &chunk.path,
+            // Value::from(f64) serializes non-finite priorities as null
+            // instead of erroring; priorities are expected to be finite.
+            priority: Value::from((chunk.priority * 1000.0).round() / 1000.0),
+            retrieval: retrieval.and_then(|plan| plan.evidence_for(chunk)).map(|evidence| {
                 serde_json::json!({
                     "score": Value::from((evidence.score * 1_000_000.0).round() / 1_000_000.0),
                     "depth": evidence.depth,
                     "reasons": evidence.reasons.iter().collect::<Vec<_>>(),
-                }),
-            );
-        }
+                })
+            }),
+            role: tags.join(","),
+            start_line: chunk.start_line,
+            symbols,
+            tags,
+            token_estimate: chunk.token_estimate,
+        };
 
-        if let Ok(line) = serde_json::to_string(&entry) {
-            lines.push(line);
+        if let Ok(line) = serde_json::to_string(&record) {
+            output.push_str(&line);
+            output.push('\n');
         }
     }
-    if lines.is_empty() {
-        String::new()
-    } else {
-        format!("{}\n", lines.join("\n"))
-    }
+    output
 }
 
 #[cfg(test)]
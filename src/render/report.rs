@@ -6,7 +6,7 @@ use crate::retrieve::RetrievalPlan;
 use crate::utils::write_atomic;
 use anyhow::Result;
 use chrono::Utc;
-use serde_json::{json, Map, Value};
+use serde_json::{Map, Value};
 use std::path::Path;
 
 /// Options for report generation.
@@ -80,13 +80,11 @@ pub fn write_report_with_retrieval(
 
     let file_manifest = sorted_files
         .iter()
-        .map(|f| {
-            json!({
-                "id": f.id,
-                "path": f.relative_path,
-                "priority": round_priority(f.priority),
-                "tokens": f.token_estimate,
-            })
+        .map(|f| FileManifestEntry {
+            id: &f.id,
+            path: &f.relative_path,
+            priority: round_priority(f.priority),
+            tokens: f.token_estimate,
         })
         .collect::<Vec<_>>();
 
@@ -127,6 +125,16 @@ pub fn write_report_with_retrieval(
     Ok(())
 }
 
+/// One row of the report's file manifest. Borrows from FileInfo so building
+/// the manifest does not clone ids and paths into an intermediate Value tree.
+#[derive(serde::Serialize)]
+struct FileManifestEntry<'a> {
+    id: &'a str,
+    path: &'a str,
+    priority: f64,
+    tokens: usize,
+}
+
 /// Rounds priority to 3 decimal places for cleaner output.
 fn round_priority(priority: f64) -> f64 {
     (priority * 1000.0).round() / 1000.0
@@ -7,18 +7,35 @@ use crate::utils::{is_binary_file, is_likely_minified, normalize_path};
 use anyhow::Result;
 use globset::{Glob, GlobSet, GlobSetBuilder};
 use ignore::WalkBuilder;
+use once_cell::sync::Lazy;
 use sha2::{Digest, Sha256};
-use std::collections::{BTreeSet, HashMap};
+use std::collections::{BTreeSet, HashMap, HashSet};
 use std::path::{Path, PathBuf};
 use std::sync::{Arc, Mutex};
 
 const DEFAULT_SAMPLE_SIZE: usize = 8192;
 const MAX_UNSEEN_FILES: usize = 50_000;
 
+static DEFAULT_EXCLUDE_GLOBSET: Lazy<GlobSet> = Lazy::new(|| {
+    let mut builder = GlobSetBuilder::new();
+    for pattern in crate::domain::default_exclude_globs() {
+        builder.add(Glob::new(&pattern).expect("default exclude glob is valid"));
+    }
+    builder.build().expect("default exclude globs compile")
+});
+
+/// Store include extensions lowercased and without the leading dot, the
+/// shape `Path::extension` produces, so the per-file check is one set lookup.
+fn normalize_extension_keys<'a>(extensions: impl Iterator<Item = &'a String>) -> HashSet<String> {
+    extensions.map(|ext| ext.trim_start_matches('.').to_lowercase()).collect()
+}
+
 /// File scanner that discovers files in a repository while respecting gitignore rules.
 pub struct FileScanner {
     root_path: PathBuf,
-    include_extensions: Vec<String>,
+    // Keyed without the leading dot so per-file lookups can use the raw
+    // `Path::extension` output directly.
+    include_extensions: HashSet<String>,
     exclude_globs: Vec<String>,
     max_file_bytes: u64,
     respect_gitignore: bool,
@@ -35,7 +52,7 @@ impl FileScanner {
     pub fn from_config(root_path: PathBuf, config: &crate::domain::Config) -> Self {
         Self {
             root_path,
-            include_extensions: config.include_extensions.iter().cloned().collect(),
+            include_extensions: normalize_extension_keys(config.include_extensions.iter()),
             exclude_globs: config.exclude_globs.iter().cloned().collect(),
             max_file_bytes: config.max_file_bytes,
             respect_gitignore: config.respect_gitignore,
@@ -52,10 +69,9 @@ impl FileScanner {
     pub fn new(root_path: PathBuf) -> Self {
         Self {
             root_path,
-            include_extensions: crate::domain::default_include_extensions()
-                .iter()
-                .map(|s| s.to_string())
-                .collect(),
+            include_extensions: normalize_extension_keys(
+                crate::domain::default_include_extensions().iter(),
+            ),
             exclude_globs: crate::domain::default_exclude_globs()
                 .iter()
                 .map(|s| s.to_string())
@@ -74,7 +90,7 @@ impl FileScanner {
     /// Set file extensions to include (e.g., ".rs", ".py")
     #[must_use]
     pub fn include_extensions(mut self, extensions: Vec<String>) -> Self {
-        self.include_extensions = extensions;
+        self.include_extensions = normalize_extension_keys(extensions.iter());
         self
     }
 
@@ -114,6 +130,12 @@ impl FileScanner {
     }
 
     fn build_exclude_globset(&self) -> Result<GlobSet> {
+        // The default exclude patterns never change at runtime; compile them
+        // once per process and hand out the shared set instead of rebuilding
+        // the automaton on every scan.
+        if crate::domain::is_default_exclude_globs(&self.exclude_globs) {
+            return Ok(DEFAULT_EXCLUDE_GLOBSET.clone());
+        }
         let mut builder = GlobSetBuilder::new();
         for pattern in &self.exclude_globs {
             match Glob::new(pattern) {
@@ -134,10 +156,10 @@ impl FileScanner {
             return true;
         }
         let ext = path.extension().and_then(|e| e.to_str()).unwrap_or("").to_lowercase();
-        let name = path.file_name().and_then(|n| n.to_str()).unwrap_or("").to_lowercase();
 
         // Handle files without extension but with known names
         if ext.is_empty() {
+            let name = path.file_name().and_then(|n| n.to_str()).unwrap_or("").to_lowercase();
             let known_extensionless = [
                 "makefile",
                 "dockerfile",
@@ -150,10 +172,7 @@ impl FileScanner {
             return known_extensionless.contains(&name.as_str());
         }
 
-        // Add leading dot if not present for comparison
-        let ext_with_dot = if ext.starts_with('.') { ext } else { format!(".{}", ext) };
-
-        self.include_extensions.contains(&ext_with_dot)
+        self.include_extensions.contains(&ext)
     }
 
     /// Scan the repository and return list of FileInfo objects.
@@ -249,8 +268,16 @@ impl FileScanner {
                 observed_symlink = true;
             }
 
-            // Skip directories.
-            if path.is_dir() {
+            // Skip directories. The walker already knows the entry's file
+            // type from the directory read, so prefer that over path.is_dir()
+            // (a fresh stat syscall per entry). Symlinks still need the
+            // following stat to learn what they point at.
+            let is_dir = if entry.path_is_symlink() {
+                path.is_dir()
+            } else {
+                entry.file_type().is_some_and(|file_type| file_type.is_dir())
+            };
+            if is_dir {
                 // A directory symlink that is not followed would otherwise
                 // vanish silently from the inventory. Record it so the report
                 // can reconcile what it skipped. Followed links (follow=true)
@@ -447,8 +474,15 @@ impl FileScanner {
 
             // Generate stable ID: SHA-256 of relative path, first 16 hex chars (matches Python)
             let id = {
+                use std::fmt::Write as _;
                 let hash = Sha256::digest(rel_path.as_bytes());
-                format!("{:x}", hash)[..16].to_string()
+                // Only the first 8 bytes appear in the id; don't format and
+                // discard the other 48 hex chars.
+                let mut id = String::with_capacity(16);
+                for byte in &hash[..8] {
+                    let _ = write!(id, "{byte:02x}");
+                }
+                id
             };
 
             // Update language stats